@@ -12,6 +12,59 @@ from plots import utility
 
 st.set_page_config(page_title="Options Pricing Visualizer", layout="wide")
 
+@st.cache_data(max_entries=32)
+def _price_surface(S, T, r, q, option_type):
+    """Black-Scholes prices over a strike x volatility grid"""
+    vol_range = np.linspace(0.1, 0.8, 50)
+    strikes = np.linspace(S*0.5, S*1.5, 50)
+    
+    # Strikes vary along columns and volatilities along rows
+    bs = B.BlackScholes(S, strikes[None, :], T, r, vol_range[:, None], q)
+    prices = bs.call_price() if option_type == "Call" else bs.put_price()
+    return strikes, vol_range, prices
+
+@st.cache_data(max_entries=32)
+def _iv_surface(S, r, market_price, option_type, q):
+    """Implied volatility of market_price over a strike x expiry grid"""
+    strikes = np.linspace(S*0.7, S*1.3, 20)
+    expiries = np.linspace(0.1, 2.0, 20)
+    
+    iv_grid = IV.iv_surface(S, strikes, expiries, r, market_price, option_type == "Call", q)
+    return strikes, expiries, iv_grid
+
+@st.cache_data(ttl=300)
+def _load_expirations(symbol):
+    """Option expiration dates listed for symbol"""
+    return yf.Ticker(symbol).options
+
+@st.cache_data(ttl=300)
+def _load_chain(symbol, expiry):
+    """Calls, puts and spot price of symbol's option chain for expiry"""
+    ticker = yf.Ticker(symbol)
+    chain = ticker.option_chain(expiry)
+    return chain.calls, chain.puts, ticker.info['regularMarketPrice']
+
+def _surface_fig(key, xaxis_title, yaxis_title, zaxis_title):
+    """Empty 3D surface figure, built once per session and reused across reruns"""
+    if key not in st.session_state:
+        fig = go.Figure(data=[go.Surface()])
+        fig.update_layout(scene=dict(
+            xaxis_title=xaxis_title,
+            yaxis_title=yaxis_title,
+            zaxis_title=zaxis_title),
+            height=800
+        )
+        st.session_state[key] = fig
+    return st.session_state[key]
+
+@st.cache_resource
+def _warm_up_kernels():
+    """Compile, or load from Numba's on-disk cache, the optional kernels once per server process"""
+    BT.BinomialTree(100.0, 100.0, 1.0, 0.05, 0.2, 10, 0.0, 'put', 'american').price()
+    IV.iv_surface(100.0, [100.0], [1.0], 0.05, 10.0, True, 0.0)
+
+_warm_up_kernels()
+
 with st.sidebar:
     st.header("Model Parameters")
     model_type = st.selectbox("Pricing Model", ["Black-Scholes", "Binomial Tree"])
@@ -55,24 +108,13 @@ with tab1:     # Pricing Models
             st.metric("Difference", f"${diff:.4f}", delta_color="off")
 
     st.subheader("Price Sensitivity Analysis")
-    vol_range = np.linspace(0.1, 0.8, 50)
-    strikes = np.linspace(S*0.5, S*1.5, 50)
-    X, Y = np.meshgrid(strikes, vol_range)
-    
-    prices = np.zeros_like(X)
-    for i in range(len(vol_range)):
-        for j in range(len(strikes)):
-            bs = B.BlackScholes(S, X[i,j], T, r, Y[i,j], q)
-            prices[i,j] = bs.call_price() if option_type == "Call" else bs.put_price()
-    
-    fig = go.Figure(data=[go.Surface(x=X, y=Y, z=prices)])
-    fig.update_layout(scene=dict(
-        xaxis_title='Strike Price',
-        yaxis_title='Volatility',
-        zaxis_title='Option Price'),
-        height=800
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    strikes, vol_range, prices = _price_surface(S, T, r, q, option_type)
+    
+    fig = _surface_fig('price_surface_fig', 'Strike Price', 'Volatility', 'Option Price')
+    fig.data[0].x = strikes.astype(np.float32)
+    fig.data[0].y = vol_range.astype(np.float32)
+    fig.data[0].z = prices.astype(np.float32)
+    st.plotly_chart(fig, use_container_width=True, key='price_surface')
 
 with tab2:  
     st.header("Option Greeks Analysis")
@@ -98,10 +140,10 @@ with tab2:
     
     if param == "Volatility":
         x = np.linspace(0.1, 0.8, 50)
-        y = [B.BlackScholes(S, K, T, r, vol, q).delta(option_type.lower()) for vol in x]
+        y = B.BlackScholes(S, K, T, r, x, q).delta(option_type.lower())
     else:
         x = np.linspace(0.1, T, 50)
-        y = [B.BlackScholes(S, K, t, r, sigma, q).delta(option_type.lower()) for t in x]
+        y = B.BlackScholes(S, K, x, r, sigma, q).delta(option_type.lower())
     
     fig = px.line(x=x, y=y, labels={'x': param, 'y': 'Delta'})
     st.plotly_chart(fig, use_container_width=True)
@@ -109,31 +151,35 @@ with tab2:
 with tab3: 
     st.header("Real Market Data Comparison")
     ticker_s=st.text_input("Enter Ticker Symbol", "AAPL")
-    ticker = yf.Ticker("AAPL") 
-    expirations = ticker.options
-    if not expirations:
-        st.error("No option expiration dates available for this ticker.")
-    else:
-        selected_expiry = st.selectbox("Select Expiration Date", expirations)
-
-        st.write(f"You selected: {selected_expiry}")
-    chain=ticker.option_chain(selected_expiry)
-    option_type = st.selectbox("Call/Put option", ["Call", "Put"])
+    selected_expiry = None
     try:
-        options = chain.calls if option_type == "Call" else chain.puts
-        S = ticker.info['regularMarketPrice']
-        # Calculate theoretical prices
-        options['Theoretical'] = options.apply(lambda row: 
-            B.BlackScholes(S, row['strike'], T, r, sigma, q).call_price()
-            if option_type == "Call" else
-            B.BlackScholes(S, row['strike'], T, r, sigma, q).put_price(), axis=1)
-        
-        st.write(f"Spot Price:{S}")
-        st.dataframe(options[['strike', 'lastPrice', 'Theoretical', 'impliedVolatility']], 
-                    use_container_width=True)
-        
+        expirations = _load_expirations(ticker_s)
     except Exception as e:
         st.error(f"Error fetching market data: {str(e)}")
+    else:
+        if not expirations:
+            st.error("No option expiration dates available for this ticker.")
+        else:
+            selected_expiry = st.selectbox("Select Expiration Date", expirations)
+
+            st.write(f"You selected: {selected_expiry}")
+    option_type = st.selectbox("Call/Put option", ["Call", "Put"])
+    if selected_expiry is not None:
+        try:
+            calls, puts, S = _load_chain(ticker_s, selected_expiry)
+            options = (calls if option_type == "Call" else puts).copy()
+            # Calculate theoretical prices
+            strikes = options['strike'].to_numpy(dtype=np.float64)
+            bs_vec = B.BlackScholes(S, strikes, T, r, sigma, q)
+            theo = bs_vec.call_price() if option_type == "Call" else bs_vec.put_price()
+            options = options.assign(Theoretical=theo)
+            
+            st.write(f"Spot Price:{S}")
+            st.dataframe(options[['strike', 'lastPrice', 'Theoretical', 'impliedVolatility']], 
+                        use_container_width=True)
+            
+        except Exception as e:
+            st.error(f"Error fetching market data: {str(e)}")
 
 with tab4:  
     st.header("Implied Volatility Analysis")
@@ -153,20 +199,10 @@ with tab4:
         st.metric("BS Price with IV", f"${int(B.BlackScholes(S, K, T, r, iv, q).call_price()*100)/100}")
     
     st.subheader("3D IV Surface")
-    strikes = np.linspace(S*0.7, S*1.3, 20)
-    expiries = np.linspace(0.1, 2.0, 20)
+    strikes, expiries, iv_grid = _iv_surface(S, r, market_price, option_type, q)
     
-    iv_grid = np.zeros((len(expiries), len(strikes)))
-    for i, T_iv in enumerate(expiries):
-        for j, K_iv in enumerate(strikes):
-            iv_calc = IV.ImpliedVolatility(S, K_iv, T_iv, r, market_price, option_type.lower(), q)
-            iv_grid[i,j] = iv_calc.calculate_iv()
-    
-    fig = go.Figure(data=[go.Surface(x=strikes, y=expiries, z=iv_grid)])
-    fig.update_layout(scene=dict(
-        xaxis_title='Strike Price',
-        yaxis_title='Time to Expiry',
-        zaxis_title='Implied Volatility'),
-        height=800
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    fig = _surface_fig('iv_surface_fig', 'Strike Price', 'Time to Expiry', 'Implied Volatility')
+    fig.data[0].x = strikes.astype(np.float32)
+    fig.data[0].y = expiries.astype(np.float32)
+    fig.data[0].z = iv_grid.astype(np.float32)
+    st.plotly_chart(fig, use_container_width=True, key='iv_surface')
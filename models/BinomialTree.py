@@ -5,6 +5,12 @@ from scipy.optimize import brentq
 import matplotlib.pyplot as plt
 from models import BlackScholes as b
 
+# The compiled kernel is optional; without Numba the NumPy path below is used
+try:
+    from models._bt_kernel import _price_binomial
+except ImportError:
+    _price_binomial = None
+
 class BinomialTree:
     def __init__(self, S, K, T, r, sigma, n=100, q=0, option_type='call', exercise_type='european'):
         """
@@ -38,64 +44,59 @@ class BinomialTree:
     
     def price(self):
         """Calculate option price using binomial tree"""
+        if _price_binomial is not None:
+            return _price_binomial(float(self.S), float(self.K), float(self.T), float(self.r),
+                                   float(self.sigma), int(self.n), float(self.q),
+                                   self.option_type == 'call', self.exercise_type == 'american')
+        
         # Initialize asset prices at maturity
-        S_T = np.zeros(self.n + 1)
-        for i in range(self.n + 1):
-            S_T[i] = self.S * (self.u ** (self.n - i)) * (self.d ** i)
+        S_T = self.S * (self.u ** self.n) * np.power(self.d / self.u, np.arange(self.n + 1))
         
         # Initialize option values at maturity
-        V = np.zeros(self.n + 1)
-        for i in range(self.n + 1):
-            if self.option_type == 'call':
-                V[i] = max(0, S_T[i] - self.K)
-            else:
-                V[i] = max(0, self.K - S_T[i])
+        sign = 1 if self.option_type == 'call' else -1
+        V = np.maximum(0, sign * (S_T - self.K))
         
-        # Backward induction
+        # Backward induction, one time step per slice update
+        S_levels = S_T
         for j in range(self.n - 1, -1, -1):
-            for i in range(j + 1):
-                # Calculate continuation value
-                V[i] = self.discount * (self.p * V[i] + (1 - self.p) * V[i + 1])
-                
-                # For American options, check early exercise
-                if self.exercise_type == 'american':
-                    S_now = self.S * (self.u ** (j - i)) * (self.d ** i)
-                    if self.option_type == 'call':
-                        exercise_value = max(0, S_now - self.K)
-                    else:
-                        exercise_value = max(0, self.K - S_now)
-                    V[i] = max(V[i], exercise_value)
+            # Calculate continuation value
+            V = self.discount * (self.p * V[:j + 1] + (1 - self.p) * V[1:j + 2])
+            
+            # For American options, check early exercise
+            if self.exercise_type == 'american':
+                S_levels = S_levels[:-1] / self.u
+                V = np.maximum(V, np.maximum(0, sign * (S_levels - self.K)))
         
         return V[0]
     
     def get_tree_data(self):
         """Get the complete tree data for visualization"""
-        # Create price tree
-        price_tree = np.zeros((self.n + 1, self.n + 1))
-        for j in range(self.n + 1):
-            for i in range(j + 1):
-                price_tree[i, j] = self.S * (self.u ** (j - i)) * (self.d ** i)
+        # Create price tree: node i at step j is S * u**(j-i) * d**i, zero below the diagonal
+        j = np.arange(self.n + 1)
+        i = np.arange(self.n + 1)[:, None]
+        price_tree = np.where(i <= j, self.S * self.u ** (j - i) * self.d ** i, 0)
         
         return price_tree
 
-# Test the Binomial Tree implementation
-bs = b.BlackScholes(S=100, K=100, T=1, r=0.05, sigma=0.2)
-bt_european = BinomialTree(S=100, K=100, T=1, r=0.05, sigma=0.2, n=100, option_type='call', exercise_type='european')
-bt_american = BinomialTree(S=100, K=100, T=1, r=0.05, sigma=0.2, n=100, option_type='call', exercise_type='american')
+if __name__ == '__main__':
+    # Test the Binomial Tree implementation
+    bs = b.BlackScholes(S=100, K=100, T=1, r=0.05, sigma=0.2)
+    bt_european = BinomialTree(S=100, K=100, T=1, r=0.05, sigma=0.2, n=100, option_type='call', exercise_type='european')
+    bt_american = BinomialTree(S=100, K=100, T=1, r=0.05, sigma=0.2, n=100, option_type='call', exercise_type='american')
 
-print("\nBinomial Tree Model Test:")
-print(f"European Call Price: ${bt_european.price():.2f}")
-print(f"American Call Price: ${bt_american.price():.2f}")
+    print("\nBinomial Tree Model Test:")
+    print(f"European Call Price: ${bt_european.price():.2f}")
+    print(f"American Call Price: ${bt_american.price():.2f}")
 
-# Compare with Black-Scholes
-bs_call = bs.call_price()
-print(f"Black-Scholes Call Price: ${bs_call:.2f}")
-print(f"Binomial vs BS difference: ${bt_european.price() - bs_call:.2f}")
+    # Compare with Black-Scholes
+    bs_call = bs.call_price()
+    print(f"Black-Scholes Call Price: ${bs_call:.2f}")
+    print(f"Binomial vs BS difference: ${bt_european.price() - bs_call:.2f}")
 
-# Test for put options
-bt_put_european = BinomialTree(S=100, K=100, T=1, r=0.05, sigma=0.2, n=100, option_type='put', exercise_type='european')
-bt_put_american = BinomialTree(S=100, K=100, T=1, r=0.05, sigma=0.2, n=100, option_type='put', exercise_type='american')
+    # Test for put options
+    bt_put_european = BinomialTree(S=100, K=100, T=1, r=0.05, sigma=0.2, n=100, option_type='put', exercise_type='european')
+    bt_put_american = BinomialTree(S=100, K=100, T=1, r=0.05, sigma=0.2, n=100, option_type='put', exercise_type='american')
 
-print(f"\nEuropean Put Price: ${bt_put_european.price():.2f}")
-print(f"American Put Price: ${bt_put_american.price():.2f}")
-print(f"Black-Scholes Put Price: ${bs.put_price():.2f}")
\ No newline at end of file
+    print(f"\nEuropean Put Price: ${bt_put_european.price():.2f}")
+    print(f"American Put Price: ${bt_put_american.price():.2f}")
+    print(f"Black-Scholes Put Price: ${bs.put_price():.2f}")
@@ -1,10 +1,17 @@
 import numpy as np
 import pandas as pd
-from scipy.stats import norm
+from scipy.special import ndtr
 import matplotlib.pyplot as plt
 import warnings
+from functools import cached_property
 warnings.filterwarnings('ignore')
 
+_INV_SQRT_2PI = 0.3989422804014327  # 1 / sqrt(2*pi)
+
+def norm_pdf(x):
+    """Standard normal density, without the scipy.stats dispatch overhead"""
+    return _INV_SQRT_2PI * np.exp(-0.5 * x * x)
+
 # First, let's create the Black-Scholes module
 class BlackScholes:
     def __init__(self, S, K, T, r, sigma, q=0):
@@ -23,41 +30,82 @@ class BlackScholes:
         self.r = r
         self.sigma = sigma
         self.q = q
-        
-        # Calculate d1 and d2
-        self.d1 = (np.log(S/K) + (r - q + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        self.d2 = self.d1 - sigma * np.sqrt(T)
+    
+    # Terms shared by the pricing and Greeks formulas, computed on first use.
+    # S, K, T and sigma may be NumPy arrays, in which case every result is element-wise
+    @cached_property
+    def _sqrt_T(self):
+        return np.sqrt(self.T)
+    
+    @cached_property
+    def _exp_qT(self):
+        return np.exp(-self.q * self.T)
+    
+    @cached_property
+    def _exp_rT(self):
+        return np.exp(-self.r * self.T)
+    
+    @cached_property
+    def d1(self):
+        """d1 term of the Black-Scholes formula"""
+        return (np.log(self.S/self.K) + (self.r - self.q + 0.5 * self.sigma * self.sigma) * self.T) / (self.sigma * self._sqrt_T)
+    
+    @cached_property
+    def d2(self):
+        """d2 term of the Black-Scholes formula"""
+        return self.d1 - self.sigma * self._sqrt_T
+    
+    @cached_property
+    def _Nd1(self):
+        return ndtr(self.d1)
+    
+    @cached_property
+    def _Nd2(self):
+        return ndtr(self.d2)
+    
+    # N(-d) is evaluated directly rather than as 1 - N(d) to keep precision in the tails
+    @cached_property
+    def _N_minus_d1(self):
+        return ndtr(-self.d1)
+    
+    @cached_property
+    def _N_minus_d2(self):
+        return ndtr(-self.d2)
+    
+    @cached_property
+    def _nd1(self):
+        return norm_pdf(self.d1)
     
     def call_price(self):
         """Calculate call option price"""
-        return (self.S * np.exp(-self.q * self.T) * norm.cdf(self.d1) - 
-                self.K * np.exp(-self.r * self.T) * norm.cdf(self.d2))
+        return (self.S * self._exp_qT * self._Nd1 - 
+                self.K * self._exp_rT * self._Nd2)
     
     def put_price(self):
         """Calculate put option price"""
-        return (self.K * np.exp(-self.r * self.T) * norm.cdf(-self.d2) - 
-                self.S * np.exp(-self.q * self.T) * norm.cdf(-self.d1))
+        return (self.K * self._exp_rT * self._N_minus_d2 - 
+                self.S * self._exp_qT * self._N_minus_d1)
     
     def delta(self, option_type='call'):
         """Calculate Delta"""
         if option_type == 'call':
-            return np.exp(-self.q * self.T) * norm.cdf(self.d1)
+            return self._exp_qT * self._Nd1
         else:
-            return np.exp(-self.q * self.T) * (norm.cdf(self.d1) - 1)
+            return self._exp_qT * (self._Nd1 - 1)
     
     def gamma(self):
         """Calculate Gamma"""
-        return (np.exp(-self.q * self.T) * norm.pdf(self.d1)) / (self.S * self.sigma * np.sqrt(self.T))
+        return (self._exp_qT * self._nd1) / (self.S * self.sigma * self._sqrt_T)
     
     def vega(self):
         """Calculate Vega"""
-        return self.S * np.exp(-self.q * self.T) * norm.pdf(self.d1) * np.sqrt(self.T) / 100
+        return self.S * self._exp_qT * self._nd1 * self._sqrt_T / 100
     
     def theta(self, option_type='call'):
         """Calculate Theta"""
-        term1 = -(self.S * np.exp(-self.q * self.T) * norm.pdf(self.d1) * self.sigma) / (2 * np.sqrt(self.T))
-        term2 = self.q * self.S * np.exp(-self.q * self.T) * norm.cdf(self.d1 if option_type=='call' else -self.d1)
-        term3 = self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(self.d2 if option_type=='call' else -self.d2)
+        term1 = -(self.S * self._exp_qT * self._nd1 * self.sigma) / (2 * self._sqrt_T)
+        term2 = self.q * self.S * self._exp_qT * (self._Nd1 if option_type=='call' else self._N_minus_d1)
+        term3 = self.r * self.K * self._exp_rT * (self._Nd2 if option_type=='call' else self._N_minus_d2)
         
         if option_type == 'call':
             return (term1 - term2 - term3) / 365
@@ -67,20 +115,41 @@ class BlackScholes:
     def rho(self, option_type='call'):
         """Calculate Rho"""
         if option_type == 'call':
-            return self.K * self.T * np.exp(-self.r * self.T) * norm.cdf(self.d2) / 100
+            return self.K * self.T * self._exp_rT * self._Nd2 / 100
         else:
-            return -self.K * self.T * np.exp(-self.r * self.T) * norm.cdf(-self.d2) / 100
+            return -self.K * self.T * self._exp_rT * self._N_minus_d2 / 100
+
+def all_greeks(S, K, T, r, sigma, q=0):
+    """
+    Calculate every Greek from one BlackScholes instance, so d1, d2 and the
+    discount factors are computed once and shared
+    Returns a dict keyed 'delta_call', 'delta_put', 'gamma', 'vega',
+    'theta_call', 'theta_put', 'rho_call' and 'rho_put', in the same units as
+    the BlackScholes methods. Inputs may be NumPy arrays.
+    """
+    bs = BlackScholes(S, K, T, r, sigma, q)
+    return {
+        'delta_call': bs.delta('call'),
+        'delta_put': bs.delta('put'),
+        'gamma': bs.gamma(),
+        'vega': bs.vega(),
+        'theta_call': bs.theta('call'),
+        'theta_put': bs.theta('put'),
+        'rho_call': bs.rho('call'),
+        'rho_put': bs.rho('put')
+    }
 
-# Test the Black-Scholes implementation
-bs = BlackScholes(S=100, K=100, T=1, r=0.05, sigma=0.2)
-print("Black-Scholes Model Test:")
-print(f"Call Price: ${bs.call_price():.2f}")
-print(f"Put Price: ${bs.put_price():.2f}")
-print(f"Call Delta: {bs.delta('call'):.4f}")
-print(f"Put Delta: {bs.delta('put'):.4f}")
-print(f"Gamma: {bs.gamma():.4f}")
-print(f"Vega: {bs.vega():.4f}")
-print(f"Call Theta: {bs.theta('call'):.4f}")
-print(f"Put Theta: {bs.theta('put'):.4f}")
-print(f"Call Rho: {bs.rho('call'):.4f}")
-print(f"Put Rho: {bs.rho('put'):.4f}")
\ No newline at end of file
+if __name__ == '__main__':
+    # Test the Black-Scholes implementation
+    bs = BlackScholes(S=100, K=100, T=1, r=0.05, sigma=0.2)
+    print("Black-Scholes Model Test:")
+    print(f"Call Price: ${bs.call_price():.2f}")
+    print(f"Put Price: ${bs.put_price():.2f}")
+    print(f"Call Delta: {bs.delta('call'):.4f}")
+    print(f"Put Delta: {bs.delta('put'):.4f}")
+    print(f"Gamma: {bs.gamma():.4f}")
+    print(f"Vega: {bs.vega():.4f}")
+    print(f"Call Theta: {bs.theta('call'):.4f}")
+    print(f"Put Theta: {bs.theta('put'):.4f}")
+    print(f"Call Rho: {bs.rho('call'):.4f}")
+    print(f"Put Rho: {bs.rho('put'):.4f}")
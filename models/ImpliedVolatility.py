@@ -1,7 +1,16 @@
 # Create the Implied Volatility module
 from models import BlackScholes as b
 from scipy.optimize import brentq
+from scipy.special import ndtr
+import numpy as np
 import pandas as pd
+
+# The compiled kernel is optional; without Numba iv_vectorized is used
+try:
+    from models._iv_kernel import iv_grid as _iv_grid
+except ImportError:
+    _iv_grid = None
+
 class ImpliedVolatility:
     def __init__(self, S, K, T, r, market_price, option_type='call', q=0):
         """
@@ -44,15 +53,22 @@ class ImpliedVolatility:
         """Calculate IV using Newton-Raphson method with Vega"""
         sigma = sigma_initial
         
+        # Invariant across iterations
+        log_SK = np.log(self.S / self.K)
+        sqrt_T = np.sqrt(self.T)
+        exp_qT = np.exp(-self.q * self.T)
+        exp_rT = np.exp(-self.r * self.T)
+        
         for i in range(max_iterations):
-            bs = b.BlackScholes(self.S, self.K, self.T, self.r, sigma, self.q)
+            d1 = (log_SK + (self.r - self.q + 0.5 * sigma * sigma) * self.T) / (sigma * sqrt_T)
+            d2 = d1 - sigma * sqrt_T
             
             if self.option_type == 'call':
-                price = bs.call_price()
+                price = self.S * exp_qT * ndtr(d1) - self.K * exp_rT * ndtr(d2)
             else:
-                price = bs.put_price()
+                price = self.K * exp_rT * ndtr(-d2) - self.S * exp_qT * ndtr(-d1)
             
-            vega = bs.vega() * 100  # Convert back from percentage
+            vega = self.S * exp_qT * b.norm_pdf(d1) * sqrt_T
             
             price_diff = price - self.market_price
             
@@ -70,50 +86,108 @@ class ImpliedVolatility:
         
         return sigma
 
-# Test the Implied Volatility calculator
-print("\nImplied Volatility Test:")
+def iv_vectorized(S, K_arr, T_arr, r, price_arr, is_call=True, q=0, max_iterations=8, tolerance=1e-6):
+    """
+    Calculate implied volatility element-wise over arrays of strikes,
+    maturities and market prices (any broadcastable shapes)
+    S: spot price
+    K_arr: strike prices
+    T_arr: times to maturity
+    r: risk-free rate
+    price_arr: observed market prices
+    is_call: True for calls, False for puts
+    q: dividend yield
+    
+    Newton-Raphson steps with analytic Vega are run on the whole grid at once,
+    seeded with the Brenner-Subrahmanyam estimate. Points that have not
+    converged fall back to Brent's method; NaN marks points with no solution.
+    """
+    K_arr, T_arr, price_arr = np.broadcast_arrays(np.asarray(K_arr, dtype=np.float64),
+                                                  np.asarray(T_arr, dtype=np.float64),
+                                                  np.asarray(price_arr, dtype=np.float64))
+    sigma = np.clip(np.sqrt(2 * np.pi / T_arr) * price_arr / S, 1e-4, 5.0)
+    converged = np.zeros(sigma.shape, dtype=bool)
+    
+    # Evaluate, test, then step; the extra pass checks the sigma from the last step
+    for i in range(max_iterations + 1):
+        bs = b.BlackScholes(S, K_arr, T_arr, r, sigma, q)
+        price = bs.call_price() if is_call else bs.put_price()
+        
+        price_diff = price - price_arr
+        converged = np.abs(price_diff) < tolerance
+        if converged.all() or i == max_iterations:
+            break
+        
+        vega = bs.vega() * 100  # Convert back from percentage
+        step = np.divide(price_diff, vega, out=np.zeros_like(price_diff), where=vega > 0)
+        sigma = np.where(converged, sigma, np.clip(sigma - step, 1e-4, 5.0))
+    
+    # Fall back to Brent's method where Newton-Raphson did not converge
+    option_type = 'call' if is_call else 'put'
+    for idx in zip(*np.nonzero(~converged)):
+        iv = ImpliedVolatility(S, K_arr[idx], T_arr[idx], r, price_arr[idx], option_type, q).calculate_iv()
+        sigma[idx] = np.nan if iv is None else iv
+    
+    return sigma
+
+def iv_surface(S, strikes, expiries, r, market_price, is_call=True, q=0):
+    """
+    Calculate implied volatility of market_price over a strike x expiry grid
+    Returns an array with one row per expiry and one column per strike.
+    Uses the compiled Numba kernel when available.
+    """
+    strikes = np.asarray(strikes, dtype=np.float64)
+    expiries = np.asarray(expiries, dtype=np.float64)
+    if _iv_grid is not None:
+        return _iv_grid(float(S), strikes, expiries, float(r), float(market_price), bool(is_call), float(q))
+    
+    return iv_vectorized(S, strikes[None, :], expiries[:, None], r, market_price, is_call, q)
+
+if __name__ == '__main__':
+    # Test the Implied Volatility calculator
+    print("\nImplied Volatility Test:")
 
-# Create a market price using known volatility
-test_sigma = 0.25
-bs_test = b.BlackScholes(S=100, K=100, T=1, r=0.05, sigma=test_sigma)
-market_call_price = bs_test.call_price()
-market_put_price = bs_test.put_price()
+    # Create a market price using known volatility
+    test_sigma = 0.25
+    bs_test = b.BlackScholes(S=100, K=100, T=1, r=0.05, sigma=test_sigma)
+    market_call_price = bs_test.call_price()
+    market_put_price = bs_test.put_price()
 
-print(f"Original volatility: {test_sigma:.3f}")
-print(f"Market call price: ${market_call_price:.2f}")
-print(f"Market put price: ${market_put_price:.2f}")
+    print(f"Original volatility: {test_sigma:.3f}")
+    print(f"Market call price: ${market_call_price:.2f}")
+    print(f"Market put price: ${market_put_price:.2f}")
 
-# Calculate implied volatility
-iv_calc_call = ImpliedVolatility(S=100, K=100, T=1, r=0.05, market_price=market_call_price, option_type='call')
-iv_calc_put = ImpliedVolatility(S=100, K=100, T=1, r=0.05, market_price=market_put_price, option_type='put')
+    # Calculate implied volatility
+    iv_calc_call = ImpliedVolatility(S=100, K=100, T=1, r=0.05, market_price=market_call_price, option_type='call')
+    iv_calc_put = ImpliedVolatility(S=100, K=100, T=1, r=0.05, market_price=market_put_price, option_type='put')
 
-iv_call = iv_calc_call.calculate_iv()
-iv_put = iv_calc_put.calculate_iv()
+    iv_call = iv_calc_call.calculate_iv()
+    iv_put = iv_calc_put.calculate_iv()
 
-print(f"Implied volatility (call): {iv_call:.3f}")
-print(f"Implied volatility (put): {iv_put:.3f}")
+    print(f"Implied volatility (call): {iv_call:.3f}")
+    print(f"Implied volatility (put): {iv_put:.3f}")
 
-# Test Newton-Raphson method
-iv_call_newton = iv_calc_call.vega_newton()
-iv_put_newton = iv_calc_put.vega_newton()
+    # Test Newton-Raphson method
+    iv_call_newton = iv_calc_call.vega_newton()
+    iv_put_newton = iv_calc_put.vega_newton()
 
-print(f"IV using Newton-Raphson (call): {iv_call_newton:.3f}")
-print(f"IV using Newton-Raphson (put): {iv_put_newton:.3f}")
+    print(f"IV using Newton-Raphson (call): {iv_call_newton:.3f}")
+    print(f"IV using Newton-Raphson (put): {iv_put_newton:.3f}")
 
-# Test with different strikes to create IV surface data
-strikes = [90, 95, 100, 105, 110]
-iv_surface_data = []
+    # Test with different strikes to create IV surface data
+    strikes = [90, 95, 100, 105, 110]
+    iv_surface_data = []
 
-print("\nIV Surface Data:")
-for K in strikes:
-    bs_surface = b.BlackScholes(S=100, K=K, T=1, r=0.05, sigma=0.2)
-    market_price = bs_surface.call_price()
-    iv_calc = ImpliedVolatility(S=100, K=K, T=1, r=0.05, market_price=market_price, option_type='call')
-    iv = iv_calc.calculate_iv()
-    iv_surface_data.append({'Strike': K, 'Market_Price': market_price, 'IV': iv})
-    print(f"Strike {K}: Market Price ${market_price:.2f}, IV {iv:.3f}")
+    print("\nIV Surface Data:")
+    for K in strikes:
+        bs_surface = b.BlackScholes(S=100, K=K, T=1, r=0.05, sigma=0.2)
+        market_price = bs_surface.call_price()
+        iv_calc = ImpliedVolatility(S=100, K=K, T=1, r=0.05, market_price=market_price, option_type='call')
+        iv = iv_calc.calculate_iv()
+        iv_surface_data.append({'Strike': K, 'Market_Price': market_price, 'IV': iv})
+        print(f"Strike {K}: Market Price ${market_price:.2f}, IV {iv:.3f}")
 
-# Convert to DataFrame for easier handling
-iv_df = pd.DataFrame(iv_surface_data)
-print("\nIV Surface DataFrame:")
-print(iv_df)
\ No newline at end of file
+    # Convert to DataFrame for easier handling
+    iv_df = pd.DataFrame(iv_surface_data)
+    print("\nIV Surface DataFrame:")
+    print(iv_df)
@@ -0,0 +1,53 @@
+# Numba kernels for the Binomial Tree model
+import numpy as np
+from numba import njit
+
+@njit(cache=True, fastmath=True)
+def _price_binomial(S, K, T, r, sigma, n, q, is_call, is_american):
+    """
+    Price an option on a CRR binomial tree with explicit loops
+    S: spot price
+    K: strike price
+    T: time to maturity (in years)
+    r: risk-free rate
+    sigma: volatility
+    n: number of time steps
+    q: dividend yield
+    is_call: True for a call, False for a put
+    is_american: True to allow early exercise at every node
+    """
+    # Tree parameters
+    dt = T / n
+    u = np.exp(sigma * np.sqrt(dt))
+    d = 1.0 / u
+    p = (np.exp((r - q) * dt) - d) / (u - d)
+    disc = np.exp(-r * dt)
+
+    # Option values at maturity; each lower node is one d/u ratio below the last
+    V = np.empty(n + 1)
+    ratio = d / u
+    S_T = S * (u ** n)
+    for i in range(n + 1):
+        if is_call:
+            V[i] = max(0.0, S_T - K)
+        else:
+            V[i] = max(0.0, K - S_T)
+        S_T *= ratio
+
+    # Backward induction; the top node at step j is S * u**j and each node
+    # below it is one d/u ratio lower, so no powers are needed per node
+    top = S * (u ** n)
+    for j in range(n - 1, -1, -1):
+        top *= d
+        S_now = top
+        for i in range(j + 1):
+            V[i] = disc * (p * V[i] + (1.0 - p) * V[i + 1])
+
+            if is_american:
+                if is_call:
+                    V[i] = max(V[i], S_now - K)
+                else:
+                    V[i] = max(V[i], K - S_now)
+                S_now *= ratio
+
+    return V[0]
@@ -0,0 +1,74 @@
+# Numba kernels for the Implied Volatility calculator
+import math
+import numpy as np
+from numba import njit
+
+_INV_SQRT2 = 0.7071067811865476  # 1 / sqrt(2)
+_INV_SQRT_2PI = 0.3989422804014327  # 1 / sqrt(2*pi)
+
+# Kept in this module so that Numba's on-disk cache, which only checks the
+# defining file of each cached kernel, sees edits to it
+@njit(inline='always')
+def _ndtr(x):
+    """Standard normal CDF for nopython code, where scipy.special.ndtr is unavailable"""
+    # erfc keeps full relative precision in the lower tail, unlike 1 + erf
+    return 0.5 * math.erfc(-x * _INV_SQRT2)
+
+@njit(cache=True, fastmath=True)
+def _newton_iv(S, K, T, r, market_price, is_call, q, max_iterations=100, tolerance=1e-6):
+    """
+    Calculate implied volatility for a single option
+    Newton-Raphson steps with Vega, safeguarded by bisection on [1e-4, 5]:
+    a step that leaves the current bracket is replaced by its midpoint.
+    Returns NaN when no volatility in the bracket reproduces market_price.
+    """
+    # Invariant across iterations
+    sqrt_T = math.sqrt(T)
+    log_SK = math.log(S / K)
+    exp_qT = math.exp(-q * T)
+    exp_rT = math.exp(-r * T)
+
+    lo = 1e-4
+    hi = 5.0
+    sigma = min(max(math.sqrt(2 * math.pi / T) * market_price / S, lo), hi)
+
+    for i in range(max_iterations):
+        d1 = (log_SK + (r - q + 0.5 * sigma * sigma) * T) / (sigma * sqrt_T)
+        d2 = d1 - sigma * sqrt_T
+        if is_call:
+            price = S * exp_qT * _ndtr(d1) - K * exp_rT * _ndtr(d2)
+        else:
+            price = K * exp_rT * _ndtr(-d2) - S * exp_qT * _ndtr(-d1)
+
+        price_diff = price - market_price
+        if abs(price_diff) < tolerance:
+            return sigma
+
+        # The price is increasing in sigma, so the root lies on one side
+        if price_diff > 0:
+            hi = sigma
+        else:
+            lo = sigma
+
+        vega = S * exp_qT * _INV_SQRT_2PI * math.exp(-0.5 * d1 * d1) * sqrt_T
+        sigma_next = sigma - price_diff / vega if vega > 0 else lo
+        if sigma_next <= lo or sigma_next >= hi:
+            sigma_next = 0.5 * (lo + hi)
+        sigma = sigma_next
+
+    return np.nan
+
+# Serial on purpose: a parallel kernel launched from Streamlit's script threads
+# either blocks interpreter exit (TBB) or aborts on concurrent sessions (workqueue)
+@njit(cache=True, fastmath=True)
+def iv_grid(S, K_arr, T_arr, r, market_price, is_call, q):
+    """
+    Implied volatility of market_price for every (expiry, strike) pair
+    Rows follow T_arr and columns follow K_arr; each cell is solved
+    independently.
+    """
+    out = np.empty((T_arr.size, K_arr.size))
+    for i in range(T_arr.size):
+        for j in range(K_arr.size):
+            out[i, j] = _newton_iv(S, K_arr[j], T_arr[i], r, market_price, is_call, q)
+    return out
@@ -8,35 +8,37 @@ class OptionsUtils:
     @staticmethod
     def generate_3d_surface_data(S_range, vol_range, K, T, r, option_type='call'):
         """Generate 3D surface data for option price vs spot and volatility"""
-        S_grid, vol_grid = np.meshgrid(S_range, vol_range)
-        price_grid = np.zeros_like(S_grid)
-        
-        for i in range(len(vol_range)):
-            for j in range(len(S_range)):
-                bs = b.BlackScholes(S_grid[i,j], K, T, r, vol_grid[i,j])
-                if option_type == 'call':
-                    price_grid[i,j] = bs.call_price()
-                else:
-                    price_grid[i,j] = bs.put_price()
+        # Price the whole grid in one call by broadcasting spot along columns and
+        # volatility along rows; float64 inputs keep ndtr on its native loop
+        S_col = np.asarray(S_range, dtype=np.float64)[None, :]
+        vol_row = np.asarray(vol_range, dtype=np.float64)[:, None]
+        bs = b.BlackScholes(S_col, K, T, r, vol_row)
+        if option_type == 'call':
+            price_grid = bs.call_price()
+        else:
+            price_grid = bs.put_price()
         
+        # Read-only broadcast views of the inputs, shaped like price_grid
+        S_grid = np.broadcast_to(S_col, price_grid.shape)
+        vol_grid = np.broadcast_to(vol_row, price_grid.shape)
         return S_grid, vol_grid, price_grid
     
     @staticmethod
     def generate_greeks_data(S, K, T, r, sigma, q=0):
         """Generate comprehensive Greeks data"""
-        bs = b.BlackScholes(S, K, T, r, sigma, q)
+        greeks = b.all_greeks(S, K, T, r, sigma, q)
         
         greeks_data = {
             'Greek': ['Delta (Call)', 'Delta (Put)', 'Gamma', 'Vega', 'Theta (Call)', 'Theta (Put)', 'Rho (Call)', 'Rho (Put)'],
             'Value': [
-                bs.delta('call'),
-                bs.delta('put'),
-                bs.gamma(),
-                bs.vega(),
-                bs.theta('call'),
-                bs.theta('put'),
-                bs.rho('call'),
-                bs.rho('put')
+                greeks['delta_call'],
+                greeks['delta_put'],
+                greeks['gamma'],
+                greeks['vega'],
+                greeks['theta_call'],
+                greeks['theta_put'],
+                greeks['rho_call'],
+                greeks['rho_put']
             ],
             'Description': [
                 'Rate of change in call option price with respect to underlying price',
@@ -69,43 +71,40 @@ class OptionsUtils:
         """Format Greeks data for better display"""
         formatted_df = greeks_df.copy()
         
-        # Round values appropriately
-        for i, greek in enumerate(formatted_df['Greek']):
-            value = formatted_df.loc[i, 'Value']
-            if 'Delta' in greek or 'Gamma' in greek:
-                formatted_df.loc[i, 'Formatted_Value'] = f"{value:.4f}"
-            elif 'Vega' in greek or 'Rho' in greek:
-                formatted_df.loc[i, 'Formatted_Value'] = f"{value:.4f}"
-            elif 'Theta' in greek:
-                formatted_df.loc[i, 'Formatted_Value'] = f"{value:.6f}"
+        # Round values appropriately: Theta is per day, so it gets more decimals
+        is_theta = formatted_df['Greek'].str.contains('Theta')
+        formatted_df['Formatted_Value'] = np.where(is_theta,
+                                                   formatted_df['Value'].map('{:.6f}'.format),
+                                                   formatted_df['Value'].map('{:.4f}'.format))
         
         return formatted_df
 
-# Test the utility functions
-print("Testing Utility Functions:")
+if __name__ == '__main__':
+    # Test the utility functions
+    print("Testing Utility Functions:")
 
-# Test Greeks data generation
-greeks_df = OptionsUtils.generate_greeks_data(S=100, K=100, T=1, r=0.05, sigma=0.2)
-print("\nGreeks Data:")
-print(greeks_df)
+    # Test Greeks data generation
+    greeks_df = OptionsUtils.generate_greeks_data(S=100, K=100, T=1, r=0.05, sigma=0.2)
+    print("\nGreeks Data:")
+    print(greeks_df)
 
-# Test formatted Greeks
-formatted_greeks = OptionsUtils.format_greeks_for_display(greeks_df)
-print("\nFormatted Greeks:")
-print(formatted_greeks[['Greek', 'Formatted_Value']])
+    # Test formatted Greeks
+    formatted_greeks = OptionsUtils.format_greeks_for_display(greeks_df)
+    print("\nFormatted Greeks:")
+    print(formatted_greeks[['Greek', 'Formatted_Value']])
 
-# Test time to maturity calculation
-test_expiry = '2024-12-31'
-ttm = OptionsUtils.time_to_maturity(test_expiry)
-print(f"\nTime to maturity for {test_expiry}: {ttm:.3f} years")
+    # Test time to maturity calculation
+    test_expiry = '2024-12-31'
+    ttm = OptionsUtils.time_to_maturity(test_expiry)
+    print(f"\nTime to maturity for {test_expiry}: {ttm:.3f} years")
 
-# Test 3D surface data generation (small sample)
-S_range = np.linspace(80, 120, 5)
-vol_range = np.linspace(0.1, 0.4, 5)
-S_grid, vol_grid, price_grid = OptionsUtils.generate_3d_surface_data(S_range, vol_range, K=100, T=1, r=0.05)
+    # Test 3D surface data generation (small sample)
+    S_range = np.linspace(80, 120, 5)
+    vol_range = np.linspace(0.1, 0.4, 5)
+    S_grid, vol_grid, price_grid = OptionsUtils.generate_3d_surface_data(S_range, vol_range, K=100, T=1, r=0.05)
 
-print("\n3D Surface Data Sample:")
-print(f"Spot prices: {S_range}")
-print(f"Volatilities: {vol_range}")
-print(f"Price grid shape: {price_grid.shape}")
-print(f"Sample prices: {price_grid[0, :]}")  # First row of prices
\ No newline at end of file
+    print("\n3D Surface Data Sample:")
+    print(f"Spot prices: {S_range}")
+    print(f"Volatilities: {vol_range}")
+    print(f"Price grid shape: {price_grid.shape}")
+    print(f"Sample prices: {price_grid[0, :]}")  # First row of prices